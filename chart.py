@@ -1,16 +1,219 @@
 import os
+import functools
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
+import matplotlib
+matplotlib.use('Agg')  # Charts are only written to files, never shown
+from matplotlib.axes import Axes
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 from typing import Dict, List, Optional
 import datetime
 
 # Constants
 OUTPUT_DIR = "output"
+FIGURE_SIZE = (12, 6)
+MAX_PLOT_POINTS = 2000  # Longer series are downsampled before plotting
+MAX_MARKER_POINTS = 365  # Longer series are drawn without markers
+DOWNSAMPLE_POINTS = 1500
+CHART_DPI = 100
 
+# Use the bundled font directly instead of resolving the sans-serif family list
+matplotlib.rcParams['font.family'] = 'DejaVu Sans'
+
+# Draw long lines in chunks and drop points that do not change the rendered path
+matplotlib.rcParams['agg.path.chunksize'] = 10000
+matplotlib.rcParams['path.simplify'] = True
+matplotlib.rcParams['path.simplify_threshold'] = 1.0
+
+# Figure shared by all charts generated in the same run
+_cached_fig = None
+
+@functools.lru_cache(maxsize=None)
 def ensure_output_dir():
-    """Ensure output directory exists."""
-    if not os.path.exists(OUTPUT_DIR):
-        os.makedirs(OUTPUT_DIR)
+    """Ensure output directory exists, checking only once per process."""
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+
+def get_figure() -> Figure:
+    """Get an empty figure to draw a chart on.
+    
+    The same figure is reused for every chart instead of creating and closing
+    a new one each time.
+    
+    Returns:
+        Cleared figure of FIGURE_SIZE
+    """
+    global _cached_fig
+    if _cached_fig is None:
+        # Create the figure directly rather than through pyplot, so it is not
+        # tracked by pyplot's global figure manager
+        _cached_fig = Figure(figsize=FIGURE_SIZE)
+        FigureCanvasAgg(_cached_fig)
+    else:
+        _cached_fig.clear()
+    return _cached_fig
+
+def save_chart(fig: Figure, output_filename: str) -> None:
+    """Save a chart to the output directory and clear the figure for reuse.
+    
+    Args:
+        fig: Figure containing the chart
+        output_filename: Name of the output file
+    """
+    ensure_output_dir()
+    output_path = os.path.join(OUTPUT_DIR, output_filename)
+    # Low PNG compression level: much faster to encode for a slightly larger file
+    fig.savefig(output_path, dpi=CHART_DPI, pil_kwargs={'optimize': False, 'compress_level': 1})
+    fig.clear()
+    print(f"Chart has been saved as {output_path}")
+
+def downsample_lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> tuple:
+    """Downsample a series with the Largest-Triangle-Three-Buckets algorithm.
+    
+    The first and last points are always kept. The points in between are split
+    into n_out - 2 buckets, and from each bucket the point forming the largest
+    triangle with the previously selected point and the average of the next
+    bucket is kept. This preserves the visual shape of the series.
+    
+    Args:
+        x: Sorted x values (numeric or datetime64)
+        y: Y values
+        n_out: Number of points to keep
+    
+    Returns:
+        Tuple of downsampled (x, y) arrays
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return x, y
+    
+    x_num = x.view('i8') if np.issubdtype(x.dtype, np.datetime64) else x
+    x_num = x_num.astype(np.float64)
+    y_num = y.astype(np.float64)
+    
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_x = x_num[end:edges[i + 2]].mean()
+            next_y = y_num[end:edges[i + 2]].mean()
+        else:
+            next_x, next_y = x_num[-1], y_num[-1]
+        area = np.abs(
+            (x_num[a] - next_x) * (y_num[start:end] - y_num[a]) -
+            (x_num[a] - x_num[start:end]) * (next_y - y_num[a])
+        )
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    return x[selected], y[selected]
+
+def plot_time_series(ax: Axes, x, y, marker: Optional[str] = None, **kwargs) -> None:
+    """Plot a series on an axis, downsampling it first if it is long.
+    
+    Series longer than MAX_PLOT_POINTS are reduced to DOWNSAMPLE_POINTS with
+    downsample_lttb. Series of MAX_MARKER_POINTS or more are drawn as plain
+    lines, since markers on a year or more of daily data overlap. Values are
+    passed to matplotlib as plain numpy arrays so dates go through the fast
+    naive datetime64 converter rather than the pandas one.
+    
+    Args:
+        ax: Axis to plot on
+        x: X values (naive datetime64 for dates)
+        y: Y values
+        marker: Marker style for each point
+        **kwargs: Additional arguments passed to ax.plot
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if len(x) >= MAX_MARKER_POINTS:
+        marker = None
+    if len(x) > MAX_PLOT_POINTS:
+        x, y = downsample_lttb(x, y, DOWNSAMPLE_POINTS)
+    # Draw at most ~100 markers per line
+    ax.plot(x, y, marker=marker, markevery=max(1, len(x) // 100), **kwargs)
+
+def get_date_range(df: pd.DataFrame, date_col: str) -> np.ndarray:
+    """Get every day from the earliest date in a column up to today.
+    
+    Args:
+        df: DataFrame containing the date column
+        date_col: Name of a datetime64 column
+    
+    Returns:
+        Array of consecutive datetime64[D] days
+    """
+    start_date = df[date_col].min().to_datetime64().astype('datetime64[D]')
+    end_date = np.datetime64(datetime.datetime.now().date(), 'D')
+    return np.arange(start_date, end_date + np.timedelta64(1, 'D'), dtype='datetime64[D]')
+
+def count_open_per_day(created: np.ndarray, closed: np.ndarray, days: np.ndarray) -> np.ndarray:
+    """Count the number of items open on each day.
+    
+    An item is open on a day if it was created on or before that day and has
+    not been closed on or before that day. Rather than scanning the items once
+    per day, the creation and close days are sorted once and the counts for
+    every day are found with a binary search.
+    
+    Args:
+        created: datetime64[D] creation day of each item
+        closed: datetime64[D] close day of each item, NaT if still open
+        days: datetime64[D] days to count open items for
+    
+    Returns:
+        Array with the number of open items for each day in days
+    """
+    created = np.sort(created)
+    closed = np.sort(closed[~np.isnat(closed)])
+    return np.searchsorted(created, days, side='right') - np.searchsorted(closed, days, side='right')
+
+def compute_open_issue_series(df_issues: pd.DataFrame, date_range: np.ndarray) -> np.ndarray:
+    """Count the number of open issues on each date of a date range.
+    
+    Args:
+        df_issues: DataFrame with created_at, closed_at and state columns
+        date_range: datetime64[D] days to count open issues for
+    
+    Returns:
+        Array with the number of open issues for each date in date_range
+    """
+    closed_issues = df_issues[(df_issues['state'] == 'closed') & df_issues['closed_at'].notna()]
+    return count_open_per_day(
+        df_issues['created_at'].values.astype('datetime64[D]'),
+        closed_issues['closed_at'].values.astype('datetime64[D]'),
+        date_range
+    )
+
+def contributors_to_frame(external_contributors: Dict[str, Dict[str, dict]]) -> pd.DataFrame:
+    """Flatten contributor data into a long-form table with compact dtypes.
+    
+    Args:
+        external_contributors: Dictionary of contributor data as accepted by
+            plot_contributor_trends
+    
+    Returns:
+        DataFrame with one row per contributor and month and the columns:
+            - username: category - Contributor login
+            - month: datetime64 - First day of the month
+            - prs: int32 - Number of PRs in the month
+            - contributions: int32 - Total contributions of the contributor
+    """
+    rows = [
+        (username, month, prs, data.get("contributions", 0))
+        for username, data in external_contributors.items()
+        for month, prs in data["months"].items()
+    ]
+    df = pd.DataFrame(rows, columns=["username", "month", "prs", "contributions"])
+    return df.astype({
+        "username": "category",
+        "prs": np.int32,
+        "contributions": np.int32
+    }).assign(month=pd.to_datetime(df["month"], format="%Y-%m"))
 
 def plot_contributor_trends(external_contributors: Dict[str, Dict[str, dict]], output_filename: str = "contributor_trends.png") -> None:
     """Create a chart showing contributions and contributors per month.
@@ -48,47 +251,33 @@ def plot_contributor_trends(external_contributors: Dict[str, Dict[str, dict]], o
         print("No data to plot")
         return
 
-    # Create monthly aggregated data
-    monthly_data = {}
-    for username, data in external_contributors.items():
-        for month, prs in data["months"].items():
-            if month not in monthly_data:
-                monthly_data[month] = {
-                    "contributions": 0,
-                    "contributors": set()
-                }
-            monthly_data[month]["contributions"] += prs
-            monthly_data[month]["contributors"].add(username)
-
-    # Convert to DataFrame
-    df = pd.DataFrame([
-        {
-            "month": month,
-            "contributions": stats["contributions"],
-            "contributors": len(stats["contributors"])
-        }
-        for month, stats in monthly_data.items()
-    ])
-    df["month"] = pd.to_datetime(df["month"] + "-01")
+    # Aggregate the long-form table by month
+    rows = contributors_to_frame(external_contributors)
+    df = rows.groupby("month", as_index=False).agg(
+        contributions=("prs", "sum"),
+        contributors=("username", "nunique")
+    )
     df = df.sort_values("month")
 
     # Create figure with two y-axes
-    fig, ax1 = plt.subplots(figsize=(12, 6))
+    fig = get_figure()
+    ax1 = fig.subplots()
 
     # Plot contributions on primary y-axis
-    ax1.plot(df["month"], df["contributions"], label="Contributions", color="blue", marker="o")
+    months = df["month"].values
+    plot_time_series(ax1, months, df["contributions"].values, marker="o", label="Contributions", color="blue")
     ax1.set_xlabel("Month")
     ax1.set_ylabel("Number of Contributions", color="blue")
     ax1.tick_params(axis="y", labelcolor="blue")
 
     # Create secondary y-axis and plot contributors
     ax2 = ax1.twinx()
-    ax2.plot(df["month"], df["contributors"], label="Contributors", color="red", marker="x")
+    plot_time_series(ax2, months, df["contributors"].values, marker="x", label="Contributors", color="red")
     ax2.set_ylabel("Number of Contributors", color="red")
     ax2.tick_params(axis="y", labelcolor="red")
 
     # Add title and grid
-    plt.title("External Contributor Activity by Month")
+    ax1.set_title("External Contributor Activity by Month")
     ax1.grid(True)
 
     # Add legends for both lines
@@ -96,19 +285,15 @@ def plot_contributor_trends(external_contributors: Dict[str, Dict[str, dict]], o
     lines2, labels2 = ax2.get_legend_handles_labels()
     ax1.legend(lines1 + lines2, labels1 + labels2, loc="upper left")
 
-    ensure_output_dir()
-    output_path = os.path.join(OUTPUT_DIR, output_filename)
-    plt.savefig(output_path)
-    plt.close()
-    print(f"Chart has been saved as {output_path}")
+    save_chart(fig, output_filename)
 
 def plot_issue_trends(df_issues: pd.DataFrame, output_filename: str = "issue_trends.png") -> None:
     """Create a chart showing issue trends over time.
     
     Args:
         df_issues: DataFrame containing issue data with the following required columns:
-            - created_at: datetime.date - When the issue was created
-            - closed_at: datetime.date - When the issue was closed (None if still open)
+            - created_at: datetime64 - Day the issue was created
+            - closed_at: datetime64 - Day the issue was closed (NaT if still open)
             - state: str - Current state of the issue ('open' or 'closed')
         output_filename: Name of the output file
     
@@ -116,58 +301,46 @@ def plot_issue_trends(df_issues: pd.DataFrame, output_filename: str = "issue_tre
         | created_at | closed_at  | state  |
         |------------|------------|--------|
         | 2023-01-01 | 2023-02-01 | closed |
-        | 2023-01-15 | None       | open   |
+        | 2023-01-15 | NaT        | open   |
         | 2023-02-01 | 2023-02-15 | closed |
     """
     if df_issues.empty:
         print("No data to plot")
         return
 
-    # Convert dates to datetime for proper comparison
-    start_date = min(df_issues['created_at'])
-    end_date = datetime.datetime.now().date()
-    date_range = pd.date_range(start=start_date, end=end_date)
+    date_range = get_date_range(df_issues, 'created_at')
     
     # Calculate open issues for each date
-    open_issues = []
-    closed_per_day = []
-    
-    for date in date_range:
-        date = date.date()
-        # Count open issues (total - closed)
-        open_count = len(df_issues[
-            (df_issues['created_at'] <= date) & 
-            (
-                ((df_issues['state'] == 'open') & (df_issues['created_at'] <= date)) |
-                ((df_issues['state'] == 'closed') & (df_issues['closed_at'] > date))
-            )
-        ])
-        open_issues.append(open_count)
-        
-        # Count issues closed on this specific date
-        closed_count = len(df_issues[df_issues['closed_at'] == date])
-        closed_per_day.append(closed_count)
+    open_issues = compute_open_issue_series(df_issues, date_range)
+    
+    # Count issues closed on each date
+    closed_per_day = (
+        df_issues['closed_at'].dropna().value_counts()
+        .reindex(pd.DatetimeIndex(date_range), fill_value=0)
+        .values
+    )
 
     # Get current open issues count
     current_open = len(df_issues[df_issues['state'] == 'open'])
 
     # Create figure with two y-axes
-    fig, ax1 = plt.subplots(figsize=(12, 6))
+    fig = get_figure()
+    ax1 = fig.subplots()
     
     # Plot open issues on primary y-axis
-    ax1.plot(date_range, open_issues, label='Open Issues', color='red', marker='o')
+    plot_time_series(ax1, date_range, open_issues, marker='o', label='Open Issues', color='red')
     ax1.set_xlabel('Date')
     ax1.set_ylabel('Number of Open Issues', color='red')
     ax1.tick_params(axis='y', labelcolor='red')
     
     # Create secondary y-axis and plot closed issues
     ax2 = ax1.twinx()
-    ax2.plot(date_range, closed_per_day, label='Closed Issues per Day', color='blue', marker='x')
+    plot_time_series(ax2, date_range, closed_per_day, marker='x', label='Closed Issues per Day', color='blue')
     ax2.set_ylabel('Number of Issues Closed per Day', color='blue')
     ax2.tick_params(axis='y', labelcolor='blue')
     
     # Add title and grid
-    plt.title(f"Issue Trends (Excluding Pull Requests)\nCurrent Open Issues: {current_open}")
+    ax1.set_title(f"Issue Trends (Excluding Pull Requests)\nCurrent Open Issues: {current_open}")
     ax1.grid(True)
     
     # Add legends for both lines
@@ -175,11 +348,7 @@ def plot_issue_trends(df_issues: pd.DataFrame, output_filename: str = "issue_tre
     lines2, labels2 = ax2.get_legend_handles_labels()
     ax1.legend(lines1 + lines2, labels1 + labels2, loc='upper left')
     
-    ensure_output_dir()
-    output_path = os.path.join(OUTPUT_DIR, output_filename)
-    plt.savefig(output_path)
-    plt.close()
-    print(f"Chart has been saved as {output_path}")
+    save_chart(fig, output_filename)
 
 def plot_open_prs_trend(open_prs_data: Dict[str, int], output_filename: str = "open_prs_trend.png") -> None:
     """Create a chart showing the number of open PRs from external contributors over time.
@@ -203,28 +372,23 @@ def plot_open_prs_trend(open_prs_data: Dict[str, int], output_filename: str = "o
         print("No data to plot")
         return
 
-    # Convert to DataFrame
-    df = pd.DataFrame([
-        {"date": datetime.datetime.strptime(date, "%Y-%m-%d"), "open_prs": count}
-        for date, count in open_prs_data.items()
-    ])
-    df = df.sort_values("date")
+    # Parse all dates in a single vectorized call and sort chronologically
+    dates = pd.to_datetime(list(open_prs_data.keys()), format="%Y-%m-%d").values
+    counts = np.fromiter(open_prs_data.values(), dtype=np.int64, count=len(open_prs_data))
+    order = np.argsort(dates)
 
     # Create figure
-    fig, ax = plt.subplots(figsize=(12, 6))
+    fig = get_figure()
+    ax = fig.subplots()
 
     # Plot open PRs
-    ax.plot(df["date"], df["open_prs"], label="Open PRs", color="purple", marker="o")
+    plot_time_series(ax, dates[order], counts[order], marker="o", label="Open PRs", color="purple")
     ax.set_xlabel("Date")
     ax.set_ylabel("Number of Open PRs")
     
     # Add title and grid
-    plt.title("Open Pull Requests from External Contributors")
+    ax.set_title("Open Pull Requests from External Contributors")
     ax.grid(True)
     ax.legend(loc="upper left")
 
-    ensure_output_dir()
-    output_path = os.path.join(OUTPUT_DIR, output_filename)
-    plt.savefig(output_path)
-    plt.close()
-    print(f"Chart has been saved as {output_path}")
+    save_chart(fig, output_filename)
@@ -1,51 +1,62 @@
 import argparse
-import json
 import os
-from datetime import datetime
-from typing import Optional, Dict, List, Set, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Optional, Dict, Iterable, List, Set, Tuple, Union
+import numpy as np
+import orjson
 import pandas as pd
-from chart import plot_contributor_trends, plot_open_prs_trend
+from chart import count_open_per_day, plot_contributor_trends, plot_open_prs_trend
 from github_api import GitHubAPI
 
-# Constants
-OUTPUT_DIR = "output"
 
-
-def fetch_org_members(github: GitHubAPI, orgs: List[str]) -> Dict[str, Set[str]]:
+def fetch_org_members(
+    github: GitHubAPI,
+    orgs: List[str],
+    cache_ttl: Optional[timedelta] = None
+) -> Dict[str, Set[str]]:
     """Fetch members for each organization.
     
+    The organizations are fetched concurrently, so the total wait is that of
+    the slowest organization rather than the sum of all of them. Their
+    requests share the client's limit on requests in flight.
+    
     Args:
         github: GitHubAPI instance
         orgs: List of organization names
+        cache_ttl: Optional time for which cached members are reused
         
     Returns:
         Dictionary mapping org names to sets of member logins
     """
-    org_members = {}
-    for org in orgs:
-        members = github.fetch_org_members(org, include_details=False)
-        org_members[org] = {member['login'] if isinstance(member, dict) else member for member in members}
-    return org_members
+    if not orgs:
+        return {}
+    
+    with ThreadPoolExecutor(max_workers=min(len(orgs), github.MAX_PAGE_WORKERS)) as executor:
+        results = executor.map(
+            lambda org: github.fetch_org_members(org, include_details=False, cache_ttl=cache_ttl),
+            orgs
+        )
+        return {
+            org: {member['login'] if isinstance(member, dict) else member for member in members}
+            for org, members in zip(orgs, results)
+        }
 
 
-def is_external_contributor(username: str, org_members: Dict[str, Set[str]], exclude_contributors: List[str]) -> bool:
-    """Check if a contributor is external.
+def get_internal_users(org_members: Dict[str, Set[str]], exclude_contributors: List[str]) -> Set[str]:
+    """Combine org members and excluded contributors into a single set.
+    
+    A contributor is external if their username is not in this set, which
+    takes one hash lookup instead of checking every organization in turn.
     
     Args:
-        username: GitHub username to check
         org_members: Dictionary of org members from fetch_org_members
         exclude_contributors: List of contributors to exclude
         
     Returns:
-        True if contributor is external, False otherwise
+        Set of usernames that are not external contributors
     """
-    if username in exclude_contributors:
-        return False
-        
-    for members in org_members.values():
-        if username in members:
-            return False
-    return True
+    return set(exclude_contributors).union(*org_members.values())
 
 
 def fetch_contributor_data(
@@ -88,22 +99,21 @@ def fetch_pr_data(
         since: Optional datetime to fetch PRs since
         
     Returns:
-        List of pull requests with basic data
+        List of pull requests with the author, state and dates of each
     """
-    return github.fetch_pull_requests(
-        repo_owner,
-        repo_name,
-        state="all",
-        since=since,
-        include_details=False  # Skip PR details to reduce API calls
-    )
+    # Only the author and dates are used, which GraphQL returns on their own
+    return github.fetch_pull_request_summaries(repo_owner, repo_name, since=since)
 
 
-def process_pr_data(prs: List[Dict], external_contributors: Dict) -> Tuple[Dict, Dict[str, int]]:
+def process_pr_data(prs: Iterable[Dict], external_contributors: Dict) -> Tuple[Dict, Dict[str, int]]:
     """Process PR data for external contributors.
     
+    The PRs are read in a single pass that keeps only the author and dates of
+    external contributors' PRs, so prs may be any iterable, such as a
+    generator of PRs from an API.
+    
     Args:
-        prs: List of pull requests
+        prs: Iterable of pull requests
         external_contributors: Dictionary of external contributors
         
     Returns:
@@ -115,36 +125,35 @@ def process_pr_data(prs: List[Dict], external_contributors: Dict) -> Tuple[Dict,
     open_prs_by_date = {}
     current_date = datetime.now().date()
     
-    # Process each PR
+    # Keep only the fields used from PRs by external contributors
+    usernames, created_at, closed_at = [], [], []
     for pr in prs:
         username = pr["user"]["login"]
-        if username not in external_contributors:
-            continue
-            
-        # Update monthly PR counts
-        created_at = datetime.strptime(pr["created_at"], "%Y-%m-%dT%H:%M:%SZ")
-        month_key = created_at.strftime("%Y-%m")
-        external_contributors[username]["prs"] += 1
-        external_contributors[username]["months"][month_key] = (
-            external_contributors[username]["months"].get(month_key, 0) + 1
-        )
-        
-        # Track open PRs over time
-        created_date = created_at.date()
-        closed_date = None
-        if pr["closed_at"]:
-            closed_date = datetime.strptime(pr["closed_at"], "%Y-%m-%dT%H:%M:%SZ").date()
-        
-        # Initialize dates if needed
-        date_range = pd.date_range(start=created_date, end=current_date)
-        for date in date_range:
-            date_str = date.strftime("%Y-%m-%d")
-            if date_str not in open_prs_by_date:
-                open_prs_by_date[date_str] = 0
-            
-            # PR is open on this date if it's created and not yet closed
-            if closed_date is None or date.date() < closed_date:
-                open_prs_by_date[date_str] += 1
+        if username in external_contributors:
+            usernames.append(username)
+            created_at.append(pr["created_at"])
+            closed_at.append(pr["closed_at"])
+    
+    # Parse all timestamps in one vectorized call per column
+    created = pd.to_datetime(created_at, format="%Y-%m-%dT%H:%M:%SZ")
+    closed = pd.to_datetime(closed_at, format="%Y-%m-%dT%H:%M:%SZ")
+    
+    # Update monthly PR counts with a single groupby
+    pr_counts = pd.DataFrame({
+        "username": usernames,
+        "month": created.strftime("%Y-%m")
+    }).groupby(["username", "month"]).size()
+    for (username, month_key), count in pr_counts.items():
+        months = external_contributors[username]["months"]
+        months[month_key] = months.get(month_key, 0) + int(count)
+        external_contributors[username]["prs"] += int(count)
+    
+    # Count open PRs for every day from the first PR to today
+    if usernames:
+        created_days = created.values.astype("datetime64[D]")
+        days = np.arange(created_days.min(), np.datetime64(current_date) + 1, dtype="datetime64[D]")
+        open_counts = count_open_per_day(created_days, closed.values.astype("datetime64[D]"), days)
+        open_prs_by_date = dict(zip(days.astype(str).tolist(), open_counts.tolist()))
     
     return external_contributors, open_prs_by_date
 
@@ -154,9 +163,10 @@ def get_external_contributors(
     repo_name: str,
     filter_orgs: list,
     exclude_contributors: list,
-    github_token: str,
+    github_token: Union[str, List[str]],
     since: Optional[datetime] = None,
-    use_cache_only: bool = False
+    use_cache_only: bool = False,
+    org_cache_ttl: Optional[timedelta] = None
 ) -> Tuple[Dict, Dict[str, int]]:
     """Fetch external contributors and their monthly PR counts.
     
@@ -165,9 +175,10 @@ def get_external_contributors(
         repo_name: Repository name
         filter_orgs: List of organizations to filter out
         exclude_contributors: List of contributors to exclude
-        github_token: GitHub API token
+        github_token: GitHub API token, or a list of tokens to use in turn
         since: Optional datetime to fetch data since
         use_cache_only: If True, only use cached data
+        org_cache_ttl: Optional time for which cached org members are reused
         
     Returns:
         Tuple containing:
@@ -177,21 +188,23 @@ def get_external_contributors(
     github = GitHubAPI(github_token, use_cache=True, use_cache_only=use_cache_only)
     
     # Get org members first to filter contributors
-    org_members = fetch_org_members(github, filter_orgs)
+    org_members = fetch_org_members(github, filter_orgs, cache_ttl=org_cache_ttl)
+    
+    internal_users = get_internal_users(org_members, exclude_contributors)
     
     # Get contributors and filter external ones
     contributors = fetch_contributor_data(github, repo_owner, repo_name, since)
     
     # Initialize external contributors
-    external_contributors = {}
-    for contributor in contributors:
-        username = contributor["login"]
-        if is_external_contributor(username, org_members, exclude_contributors):
-            external_contributors[username] = {
-                "prs": 0,
-                "months": {},
-                "contributions": contributor.get('contributions', 0)
-            }
+    external_contributors = {
+        contributor["login"]: {
+            "prs": 0,
+            "months": {},
+            "contributions": contributor.get('contributions', 0)
+        }
+        for contributor in contributors
+        if contributor["login"] not in internal_users
+    }
     
     if not external_contributors:
         return {}, {}
@@ -217,18 +230,22 @@ def print_external_contributors(external_contributors: Dict) -> None:
 
 def convert_to_tsv(external_contributors: Dict) -> str:
     """Convert external contributors data to TSV format."""
-    tsv_data = "Contributor\tTotal PRs\tTotal Contributions\tMonth\tPRs\n"
-    for username, data in external_contributors.items():
-        contributions = data.get("contributions", "unknown")
-        for month, count in data["months"].items():
-            tsv_data += f"{username}\t{data['prs']}\t{contributions}\t{month}\t{count}\n"
-    return tsv_data
+    rows = [
+        (username, data["prs"], data.get("contributions", "unknown"), month, count)
+        for username, data in external_contributors.items()
+        for month, count in data["months"].items()
+    ]
+    df = pd.DataFrame(rows, columns=["Contributor", "Total PRs", "Total Contributions", "Month", "PRs"])
+    return df.to_csv(sep="\t", index=False, lineterminator="\n")
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Get external contributors")
     parser.add_argument("--repo-owner", help="Repository owner")
     parser.add_argument("--repo-name", help="Repository name")
     parser.add_argument("--github-token", help="GitHub token")
+    parser.add_argument(
+        "--github-tokens", nargs="+", help="GitHub tokens to use in turn, for a higher rate limit"
+    )
     parser.add_argument(
         "--filter-organizations", nargs="+", help="Organizations to filter out"
     )
@@ -242,10 +259,13 @@ if __name__ == "__main__":
     parser.add_argument(
         "--use-cache-only", action="store_true", help="Only use cached data, no API calls"
     )
+    parser.add_argument(
+        "--org-cache-ttl", type=float, help="Hours to reuse cached organization members"
+    )
     args = parser.parse_args()
     repo_owner = args.repo_owner or os.environ.get("REPO_OWNER")
     repo_name = args.repo_name or os.environ.get("REPO_NAME")
-    github_token = args.github_token or os.environ.get("GITHUB_TOKEN")
+    github_token = args.github_tokens or args.github_token or os.environ.get("GITHUB_TOKEN")
     filter_orgs = args.filter_organizations or os.environ.get("FILTER_ORGS")
     exclude_contributors = args.exclude_contributors or os.environ.get(
         "EXCLUDE_CONTRIBUTORS"
@@ -267,7 +287,8 @@ if __name__ == "__main__":
         exclude_contributors or [],
         github_token,
         since=since_date,
-        use_cache_only=args.use_cache_only
+        use_cache_only=args.use_cache_only,
+        org_cache_ttl=timedelta(hours=args.org_cache_ttl) if args.org_cache_ttl is not None else None
     )
     
     # Generate both charts
@@ -284,4 +305,4 @@ if __name__ == "__main__":
         tsv_data = convert_to_tsv(external_contributors)
         print(tsv_data)
     else:
-        print(json.dumps(output_data, indent=4))
+        print(orjson.dumps(output_data, option=orjson.OPT_INDENT_2).decode())
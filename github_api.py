@@ -1,34 +1,202 @@
 import requests
+from requests.adapters import HTTPAdapter
+from requests.auth import AuthBase
+import itertools
 import logging
+import threading
+import time
+import orjson
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Any, Generator
+from typing import List, Dict, Optional, Any, Generator, Set, Tuple, Union
+from urllib.parse import urlparse, parse_qs, urlencode
 from github_cache import GitHubCache
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+class BoundedHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that limits how many requests are in flight at once.
+    
+    A GitHubAPI client sends all of its requests through one adapter, so
+    nested fan-out, such as several organizations each fetching their pages
+    in parallel, shares a single limit and never outgrows the connection pool.
+    """
+    
+    def __init__(self, max_requests: int):
+        """Initialize the adapter.
+        
+        Args:
+            max_requests: Maximum number of requests in flight at once
+        """
+        self._slots = threading.BoundedSemaphore(max_requests)
+        super().__init__(pool_maxsize=max_requests)
+    
+    def send(self, request: requests.PreparedRequest, stream: bool = False, **kwargs) -> requests.Response:
+        with self._slots:
+            response = super().send(request, stream=stream, **kwargs)
+            if not stream:
+                # Read the body while holding the slot, so its connection is
+                # back in the pool before another request can start
+                response.content
+            return response
+
+
+class RotatingTokenAuth(AuthBase):
+    """Authenticate requests with GitHub tokens in round-robin order.
+    
+    Each token has its own rate limit, so spreading requests over several
+    tokens multiplies the number of requests per hour. A token that hits its
+    limit is skipped until GitHub's X-RateLimit-Reset time, and the request
+    is retried with the next available token.
+    """
+    
+    def __init__(self, tokens: List[str]):
+        """Initialize with the tokens to rotate through.
+        
+        Args:
+            tokens: GitHub API tokens
+        """
+        self.tokens = list(tokens)
+        self._cycle = itertools.cycle(self.tokens)
+        self._reset_at: Dict[str, float] = {}
+        self._lock = threading.Lock()
+    
+    def _next_token(self, exclude: Set[str] = frozenset()) -> Optional[str]:
+        """Return the next token that is not rate limited or excluded, or None."""
+        with self._lock:
+            now = time.time()
+            for _ in range(len(self.tokens)):
+                token = next(self._cycle)
+                if token not in exclude and self._reset_at.get(token, 0) <= now:
+                    return token
+            return None
+    
+    @staticmethod
+    def _is_rate_limited(response: requests.Response) -> bool:
+        """Check whether a response is a rate limit error."""
+        return response.status_code == 429 or (
+            response.status_code == 403 and response.headers.get('X-RateLimit-Remaining') == '0'
+        )
+    
+    def _handle_rate_limit(self, response: requests.Response, **kwargs) -> requests.Response:
+        """Retry a rate-limited request with each other available token at most once."""
+        rejected = set()
+        while self._is_rate_limited(response) and len(rejected) < len(self.tokens):
+            token = response.request.headers['Authorization'].split(' ', 1)[1]
+            rejected.add(token)
+            if 'X-RateLimit-Reset' in response.headers:
+                reset_at = float(response.headers['X-RateLimit-Reset'])
+            else:
+                reset_at = time.time() + float(response.headers.get('Retry-After', 60))
+            with self._lock:
+                self._reset_at[token] = reset_at
+            
+            # A reset time that has already passed must not hand back the
+            # token that was just rejected
+            next_token = self._next_token(exclude=rejected)
+            if next_token is None:
+                logging.warning("All GitHub tokens are rate limited")
+                return response
+            
+            logging.info("GitHub token is rate limited, retrying with the next token")
+            response.close()
+            request = response.request.copy()
+            request.headers['Authorization'] = f'token {next_token}'
+            retry = response.connection.send(request, **kwargs)
+            retry.history.append(response)
+            retry.request = request
+            response = retry
+        return response
+    
+    def __call__(self, request: requests.PreparedRequest) -> requests.PreparedRequest:
+        # Fall back to the first token when all are cooling off; GitHub will
+        # answer with the rate limit error for the caller to log
+        token = self._next_token() or self.tokens[0]
+        request.headers['Authorization'] = f'token {token}'
+        request.register_hook('response', self._handle_rate_limit)
+        return request
+
+
 class GitHubAPI:
     """Centralized GitHub API client for repository analysis."""
     
     BASE_URL = "https://api.github.com"
+    MAX_PAGE_WORKERS = 8  # Concurrent requests per client, kept low for GitHub's secondary rate limits
     
-    def __init__(self, token: str, use_cache: bool = True, use_cache_only: bool = False):
+    def __init__(
+        self,
+        token: Union[str, List[str]],
+        use_cache: bool = True,
+        use_cache_only: bool = False,
+        revalidate: bool = True
+    ):
         """Initialize GitHub API client with authentication token.
         
         Args:
-            token: GitHub API token
+            token: GitHub API token, or a list of tokens to use in turn
             use_cache: Whether to use caching for API requests
             use_cache_only: If True, only return cached data and never make API calls
+            revalidate: Whether to revalidate cached pages with conditional
+                requests, so only pages that changed are downloaded again
         """
         self.headers = {
             'Accept': 'application/vnd.github.v3+json',
-            'Authorization': f'token {token}',
             'Content-Type': 'application/json'
         }
+        # Reuse connections across requests instead of a new TLS handshake
+        # for every page; the adapter caps requests in flight at the pool size
+        self.session = requests.Session()
+        adapter = BoundedHTTPAdapter(self.MAX_PAGE_WORKERS)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.auth = RotatingTokenAuth([token] if isinstance(token, str) else token)
         self.use_cache = use_cache
         self.use_cache_only = use_cache_only
+        self.revalidate = revalidate
         self.cache = GitHubCache() if use_cache else None
     
+    @staticmethod
+    def _parse_json(response: requests.Response) -> Any:
+        """Parse a JSON response body.
+        
+        Uses orjson, which is several times faster than the standard library
+        parser behind response.json() on large pages of issues and PRs.
+        
+        Args:
+            response: Response from the GitHub API
+            
+        Returns:
+            Parsed JSON data
+        """
+        return orjson.loads(response.content)
+    
+    def graphql(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """Run a query against the GitHub GraphQL API.
+        
+        Args:
+            query: GraphQL query
+            variables: Optional query variables
+            
+        Returns:
+            The query's data, or None if the request failed
+        """
+        response = self.session.post(
+            f"{self.BASE_URL}/graphql",
+            headers=self.headers,
+            data=orjson.dumps({'query': query, 'variables': variables or {}})
+        )
+        if response.status_code != 200:
+            logging.error(f"GraphQL request failed: {self._parse_json(response).get('message', 'No error message')}")
+            return None
+        
+        result = self._parse_json(response)
+        if result.get('errors'):
+            logging.error(f"GraphQL request failed: {result['errors'][0].get('message', 'No error message')}")
+            return None
+        return result['data']
+    
     def _get_repository_stats(self, repo: str) -> Dict[str, Any]:
         """Get repository statistics including issue and PR counts.
         
@@ -39,11 +207,11 @@ class GitHubAPI:
             Repository statistics
         """
         url = f"{self.BASE_URL}/repos/{repo}"
-        response = requests.get(url, headers=self.headers)
+        response = self.session.get(url, headers=self.headers)
         if response.status_code != 200:
-            logging.error(f"Failed to fetch repository stats: {response.json().get('message', 'No error message')}")
+            logging.error(f"Failed to fetch repository stats: {self._parse_json(response).get('message', 'No error message')}")
             return {}
-        return response.json()
+        return self._parse_json(response)
     
     def _fetch_item_details(self, repo: str, item_type: str, number: int) -> Optional[Dict[str, Any]]:
         """Fetch full details for an issue or PR including comments and events.
@@ -59,12 +227,12 @@ class GitHubAPI:
         try:
             # Get main item details
             url = f"{self.BASE_URL}/repos/{repo}/{item_type}/{number}"
-            response = requests.get(url, headers=self.headers)
+            response = self.session.get(url, headers=self.headers)
             if response.status_code != 200:
                 logging.warning(f"Failed to fetch {item_type} {number}: {response.status_code}")
                 return None
             
-            item = response.json()
+            item = self._parse_json(response)
             
             try:
                 # Get comments
@@ -94,34 +262,170 @@ class GitHubAPI:
             logging.warning(f"Error fetching details for {item_type} {number}: {e}")
             return None
     
-    def _make_paginated_request(self, url: str, params: Optional[Dict] = None) -> Generator[List[Dict], None, None]:
+    def _get_page_urls(self, next_url: str, last_url: Optional[str]) -> Optional[List[str]]:
+        """Build the URLs of all remaining pages from the Link header URLs.
+        
+        Args:
+            next_url: URL of the next page
+            last_url: URL of the last page, if provided
+            
+        Returns:
+            URLs for every page from next_url to last_url, or None if the
+            endpoint does not use numbered pages
+        """
+        if not last_url:
+            return None
+        next_parts = urlparse(next_url)
+        next_query = parse_qs(next_parts.query)
+        last_query = parse_qs(urlparse(last_url).query)
+        if 'page' not in next_query or 'page' not in last_query:
+            return None
+        
+        urls = []
+        for page in range(int(next_query['page'][0]), int(last_query['page'][0]) + 1):
+            next_query['page'] = [str(page)]
+            urls.append(next_parts._replace(query=urlencode(next_query, doseq=True)).geturl())
+        return urls
+    
+    def _get_page(
+        self,
+        url: str,
+        params: Optional[Dict] = None,
+        conditional: bool = False
+    ) -> Tuple[Optional[Any], Dict[str, str], bool]:
+        """Fetch one page of results.
+        
+        With conditional set, a page that was fetched before is requested with
+        its ETag in If-None-Match. GitHub answers 304 Not Modified, with no body
+        and without counting against the rate limit, if the page has not
+        changed, and the cached copy of the page is used instead.
+        
+        Args:
+            url: Page URL
+            params: Optional query parameters
+            conditional: Whether to revalidate a cached copy of the page
+            
+        Returns:
+            Tuple of the page data (None if the request failed), the Link header
+            URLs by relation, and whether the page was unchanged
+        """
+        headers = self.headers
+        cached_page = None
+        if conditional and self.cache:
+            url = requests.Request('GET', url, params=params).prepare().url
+            params = None
+            cached_page = self.cache.load_page(url)
+            if cached_page:
+                headers = {**self.headers, 'If-None-Match': cached_page['etag']}
+        
+        response = self.session.get(url, headers=headers, params=params)
+        if response.status_code == 304 and cached_page:
+            return cached_page['data'], cached_page['links'], True
+        if response.status_code != 200:
+            logging.error(f"API request failed: {self._parse_json(response).get('message', 'No error message')}")
+            return None, {}, False
+        
+        data = self._parse_json(response)
+        links = {rel: link['url'] for rel, link in response.links.items()}
+        if conditional and self.cache and response.headers.get('ETag'):
+            self.cache.save_page(url, response.headers['ETag'], data, links)
+        return data, links, False
+    
+    def _make_paginated_request(
+        self,
+        url: str,
+        params: Optional[Dict] = None,
+        conditional: bool = False,
+        unchanged: Optional[List[bool]] = None
+    ) -> Generator[List[Dict], None, None]:
         """Make a paginated request to the GitHub API.
         
+        The first page is fetched on its own. If its Link header gives the
+        number of the last page, the remaining pages are fetched concurrently
+        and yielded in order; otherwise the next links are followed one by one.
+        
         Args:
             url: The API endpoint URL
             params: Optional query parameters
+            conditional: Whether to revalidate cached copies of the pages with
+                their ETags, so only pages that changed are downloaded again
+            unchanged: Optional list to append, for each yielded page,
+                whether it was unchanged since it was cached
             
         Yields:
             List of items from each page
         """
-        if params is None:
-            params = {}
+        data, links, page_unchanged = self._get_page(url, params, conditional)
+        if not data:  # Request failed or no items to fetch
+            return
         
-        while url:
-            response = requests.get(url, headers=self.headers, params=params)
-            if response.status_code != 200:
-                logging.error(f"API request failed: {response.json().get('message', 'No error message')}")
-                break
+        if unchanged is not None:
+            unchanged.append(page_unchanged)
+        yield data
+        
+        next_url = links.get('next')
+        if not next_url:
+            return
+        
+        page_urls = self._get_page_urls(next_url, links.get('last'))
+        if page_urls is None:
+            # Follow next links sequentially
+            url = next_url
+            while url:
+                data, links, page_unchanged = self._get_page(url, conditional=conditional)
+                if not data:  # Request failed or no more items to fetch
+                    break
                 
-            data = response.json()
-            if not data:  # No more items to fetch
-                break
+                if unchanged is not None:
+                    unchanged.append(page_unchanged)
+                yield data
                 
-            yield data
+                # Get next page URL from Link header
+                url = links.get('next')
+            return
+        
+        with ThreadPoolExecutor(max_workers=self.MAX_PAGE_WORKERS) as executor:
+            # Keep at most MAX_PAGE_WORKERS pages in flight and request the next
+            # one only when the caller asks for another page, so a caller that
+            # stops early does not cause the remaining pages to be downloaded
+            page_urls = iter(page_urls)
+            futures = deque(
+                executor.submit(self._get_page, page_url, conditional=conditional)
+                for page_url in itertools.islice(page_urls, self.MAX_PAGE_WORKERS)
+            )
+            try:
+                while futures:
+                    data, _, page_unchanged = futures.popleft().result()
+                    if not data:  # Request failed or no more items to fetch
+                        break
+                    
+                    if unchanged is not None:
+                        unchanged.append(page_unchanged)
+                    yield data
+                    
+                    page_url = next(page_urls, None)
+                    if page_url:
+                        futures.append(executor.submit(self._get_page, page_url, conditional=conditional))
+            finally:
+                # Don't fetch pages that have not started if the caller stopped early
+                for future in futures:
+                    future.cancel()
+    
+    def _load_cached_items(self, cache_path: Optional[str], key: str) -> Dict[Any, Dict[str, Any]]:
+        """Index the items of a cache by key, even if the cache is stale.
+        
+        Used to reuse the details of items that have not changed instead of
+        fetching them again.
+        
+        Args:
+            cache_path: Cache file path
+            key: Item field to index by
             
-            # Get next page URL from Link header
-            url = response.links.get('next', {}).get('url')
-            params = {}  # Reset params for next page as they're included in the URL
+        Returns:
+            Dictionary mapping keys to cached items
+        """
+        cached = self.cache.load(cache_path, use_cache_only=True) if self.cache and cache_path else None
+        return {item[key]: item for item in cached['data'] if key in item} if cached else {}
     
     def fetch_issues(
         self,
@@ -205,8 +509,12 @@ class GitHubAPI:
             )
             params['since'] = newest_date.isoformat()
         
+        conditional = use_cache and self.revalidate
+        # Issues whose updated_at has not changed keep their cached details
+        cached_issues = self._load_cached_items(cache_path, 'id') if include_details and conditional else {}
+        
         issues = []
-        for page in self._make_paginated_request(url, params):
+        for page in self._make_paginated_request(url, params, conditional=conditional):
             # Filter out pull requests
             actual_issues = [issue for issue in page if not issue.get('pull_request')]
             
@@ -214,7 +522,9 @@ class GitHubAPI:
                 # Fetch full details for each issue
                 detailed_issues = []
                 for issue in actual_issues:
-                    details = self._fetch_item_details(repo, 'issues', issue['number'])
+                    details = cached_issues.get(issue['id'])
+                    if not details or details.get('updated_at') != issue['updated_at']:
+                        details = self._fetch_item_details(repo, 'issues', issue['number'])
                     if details:
                         detailed_issues.append(details)
                 actual_issues = detailed_issues
@@ -305,13 +615,23 @@ class GitHubAPI:
         if use_cache_only:
             return []
         
+        conditional = use_cache and self.revalidate
+        # Contributors on pages that have not changed keep their cached details
+        cached_contributors = self._load_cached_items(cache_path, 'login') if include_details and conditional else {}
+        
         contributors = []
-        for page in self._make_paginated_request(url, params):
+        unchanged = []
+        for page in self._make_paginated_request(url, params, conditional=conditional, unchanged=unchanged):
             contributors.extend(page)
             
             if include_details:
                 # Fetch additional contribution data for each contributor
-                for contributor in contributors:
+                for contributor in page:
+                    cached_contributor = cached_contributors.get(contributor['login'])
+                    if unchanged[-1] and cached_contributor:
+                        contributor.update(cached_contributor)
+                        continue
+                    
                     try:
                         # Get first contribution date
                         commits_url = f"{self.BASE_URL}/repos/{repo}/commits"
@@ -321,9 +641,10 @@ class GitHubAPI:
                             'sort': 'created',
                             'order': 'asc'
                         }
-                        response = requests.get(commits_url, headers=self.headers, params=params)
-                        if response.status_code == 200 and response.json():
-                            first_commit = response.json()[0]
+                        response = self.session.get(commits_url, headers=self.headers, params=params)
+                        commits = self._parse_json(response) if response.status_code == 200 else None
+                        if commits:
+                            first_commit = commits[0]
                             contributor['first_contribution_at'] = first_commit['commit']['author']['date']
                         else:
                             logging.warning(f"Failed to fetch first commit for {contributor['login']}: {response.status_code}")
@@ -333,9 +654,9 @@ class GitHubAPI:
                     try:
                         # Get contribution stats
                         stats_url = f"{self.BASE_URL}/repos/{repo}/stats/contributors"
-                        response = requests.get(stats_url, headers=self.headers)
+                        response = self.session.get(stats_url, headers=self.headers)
                         if response.status_code == 200:
-                            stats = response.json()
+                            stats = self._parse_json(response)
                             for stat in stats:
                                 if stat['author']['login'] == contributor['login']:
                                     contributor['contribution_stats'] = stat
@@ -384,7 +705,8 @@ class GitHubAPI:
         org: str,
         use_cache: Optional[bool] = None,
         use_cache_only: Optional[bool] = None,
-        include_details: bool = True
+        include_details: bool = True,
+        cache_ttl: Optional[timedelta] = None
     ) -> List[Dict[str, Any]]:
         """Fetch all members of an organization with complete data.
         
@@ -393,6 +715,8 @@ class GitHubAPI:
             use_cache: Override instance cache setting
             use_cache_only: Override instance cache_only setting
             include_details: Whether to fetch member details
+            cache_ttl: Optional time for which cached members are used without
+                any API call, replacing the default staleness checks
             
         Returns:
             List of organization members with complete data
@@ -402,19 +726,27 @@ class GitHubAPI:
         endpoint = f"/orgs/{org}/members"
         url = f"{self.BASE_URL}{endpoint}"
         params = {'role': 'all'}
+        cache_path = self.cache.get_cache_path(endpoint, params) if self.cache else None
+        
+        # Membership rarely changes, so within an explicit TTL the cached
+        # members are trusted without checking them against the org stats
+        if cache_ttl is not None and use_cache and cache_path and not use_cache_only:
+            cached = self.cache.load(cache_path, max_age=cache_ttl)
+            if cached:
+                logging.info(f"Using cached members for organization {org}")
+                return cached['data']
         
         # Get organization stats first
         org_stats_url = f"{self.BASE_URL}/orgs/{org}"
         org_stats = {}
         if not use_cache_only:
-            response = requests.get(org_stats_url, headers=self.headers)
+            response = self.session.get(org_stats_url, headers=self.headers)
             if response.status_code == 200:
-                org_stats = response.json()
+                org_stats = self._parse_json(response)
         
-        cache_path = self.cache.get_cache_path(endpoint, params) if self.cache else None
         cached = None
         if use_cache or use_cache_only:
-            cached = self.cache.load(cache_path, use_cache_only) if cache_path else None
+            cached = self.cache.load(cache_path, use_cache_only, max_age=cache_ttl) if cache_path else None
             
         if cached:
             cached_data = cached['data']
@@ -437,24 +769,33 @@ class GitHubAPI:
         if use_cache_only:
             return []
         
+        conditional = use_cache and self.revalidate
+        # Members on pages that have not changed keep their cached details
+        cached_members = self._load_cached_items(cache_path, 'login') if include_details and conditional else {}
+        
         members = []
-        for page in self._make_paginated_request(url, params):
+        unchanged = []
+        for page in self._make_paginated_request(url, params, conditional=conditional, unchanged=unchanged):
             if include_details:
                 # Fetch additional details for each member
                 detailed_members = []
                 for member in page:
+                    if unchanged[-1] and member['login'] in cached_members:
+                        detailed_members.append(cached_members[member['login']])
+                        continue
+                    
                     try:
                         # Get user details
                         user_url = f"{self.BASE_URL}/users/{member['login']}"
-                        response = requests.get(user_url, headers=self.headers)
+                        response = self.session.get(user_url, headers=self.headers)
                         if response.status_code == 200:
-                            user_details = response.json()
+                            user_details = self._parse_json(response)
                             try:
                                 # Get organization-specific membership details
                                 membership_url = f"{self.BASE_URL}/orgs/{org}/memberships/{member['login']}"
-                                membership_response = requests.get(membership_url, headers=self.headers)
+                                membership_response = self.session.get(membership_url, headers=self.headers)
                                 if membership_response.status_code == 200:
-                                    user_details['org_membership'] = membership_response.json()
+                                    user_details['org_membership'] = self._parse_json(membership_response)
                                 else:
                                     logging.warning(f"Failed to fetch org membership for {member['login']}: {membership_response.status_code}")
                             except Exception as e:
@@ -579,12 +920,21 @@ class GitHubAPI:
             )
             params['since'] = newest_date.isoformat()
         
+        conditional = use_cache and self.revalidate
+        # PRs whose updated_at has not changed keep their cached details
+        cached_prs = self._load_cached_items(cache_path, 'number') if include_details and conditional else {}
+        
         prs = []
-        for page in self._make_paginated_request(url, params):
+        for page in self._make_paginated_request(url, params, conditional=conditional):
             if include_details:
                 # Fetch full details for each PR
                 detailed_prs = []
                 for pr in page:
+                    cached_pr = cached_prs.get(pr['number'])
+                    if cached_pr and cached_pr.get('updated_at') == pr['updated_at']:
+                        detailed_prs.append(cached_pr)
+                        continue
+                    
                     try:
                         details = self._fetch_item_details(repo, 'pulls', pr['number'])
                         if details:
@@ -649,3 +999,103 @@ class GitHubAPI:
                 )
         
         return prs
+    
+    PULL_REQUEST_SUMMARY_QUERY = """
+    query($owner: String!, $name: String!, $cursor: String) {
+        repository(owner: $owner, name: $name) {
+            pullRequests(first: 100, after: $cursor, orderBy: {field: CREATED_AT, direction: DESC}) {
+                pageInfo { endCursor hasNextPage }
+                nodes { number state createdAt closedAt author { __typename login } }
+            }
+        }
+    }
+    """
+    
+    def fetch_pull_request_summaries(
+        self,
+        repo_owner: str,
+        repo_name: str,
+        since: Optional[datetime] = None,
+        use_cache: Optional[bool] = None,
+        use_cache_only: Optional[bool] = None
+    ) -> List[Dict[str, Any]]:
+        """Fetch the author, state and dates of every pull request.
+        
+        Uses the GraphQL API, which returns only the requested fields for 100
+        PRs per request, instead of the full REST payload for 30. The PRs have
+        the same shape as those from fetch_pull_requests, limited to the
+        number, state, created_at, closed_at and user.login fields. PRs are
+        fetched newest first, so paging stops at the first PR older than since.
+        
+        Args:
+            repo_owner: Repository owner
+            repo_name: Repository name
+            since: Optional datetime to fetch PRs created since
+            use_cache: Override instance cache setting
+            use_cache_only: Override instance cache_only setting
+            
+        Returns:
+            List of pull request summaries
+        """
+        use_cache = self.use_cache if use_cache is None else use_cache
+        use_cache_only = self.use_cache_only if use_cache_only is None else use_cache_only
+        repo = f"{repo_owner}/{repo_name}"
+        
+        since_str = since.strftime('%Y-%m-%dT%H:%M:%SZ') if since else None
+        cache_params = {'fields': 'summary'}
+        if since_str:
+            cache_params['since'] = since_str
+        cache_path = self.cache.get_cache_path(f"/repos/{repo}/pulls", cache_params) if self.cache else None
+        prs = None
+        if (use_cache or use_cache_only) and cache_path:
+            cached = self.cache.load(cache_path, use_cache_only)
+            if cached:
+                logging.info(f"Using cached pull request summaries for {repo}")
+                prs = cached['data']
+        
+        if prs is None:
+            if use_cache_only:
+                logging.warning(f"No cached data available for {repo} and cache-only mode is enabled")
+                return []
+            
+            prs = []
+            complete = False
+            variables = {'owner': repo_owner, 'name': repo_name, 'cursor': None}
+            while True:
+                data = self.graphql(self.PULL_REQUEST_SUMMARY_QUERY, variables)
+                if not data or not data.get('repository'):
+                    break
+                
+                pull_requests = data['repository']['pullRequests']
+                reached_since = False
+                for node in pull_requests['nodes']:
+                    if since_str and node['createdAt'] < since_str:
+                        reached_since = True
+                        break
+                    # Deleted accounts have no author
+                    author = node['author'] or {'__typename': 'User', 'login': 'ghost'}
+                    login = author['login']
+                    if author['__typename'] == 'Bot':
+                        # REST logins of bots end in [bot], GraphQL ones don't
+                        login = f"{login}[bot]"
+                    prs.append({
+                        'number': node['number'],
+                        'state': 'open' if node['state'] == 'OPEN' else 'closed',
+                        'created_at': node['createdAt'],
+                        'closed_at': node['closedAt'],
+                        'user': {'login': login}
+                    })
+                
+                if reached_since or not pull_requests['pageInfo']['hasNextPage']:
+                    complete = True
+                    break
+                variables['cursor'] = pull_requests['pageInfo']['endCursor']
+            
+            # Only cache a complete listing, so a failed request is retried on
+            # the next run instead of hiding PRs until the cache goes stale
+            if not complete:
+                logging.error(f"Failed to fetch all pull requests for {repo}, {len(prs)} fetched. Results are incomplete and were not cached.")
+            elif use_cache and self.cache:
+                self.cache.save(cache_path, prs)
+        
+        return prs
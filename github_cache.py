@@ -1,11 +1,16 @@
 import os
-import json
+import hashlib
+import orjson
 import logging
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional
 
 class GitHubCache:
-    """Handles caching of GitHub API responses."""
+    """Handles caching of GitHub API responses.
+    
+    Cache files are read and written with orjson, since the issue and PR
+    caches are the largest JSON documents parsed on every run.
+    """
     
     def __init__(self, cache_dir: str = ".cache"):
         """Initialize the cache handler.
@@ -37,7 +42,13 @@ class GitHubCache:
             cache_key = f"{cache_key}_{param_str}"
         return os.path.join(self.cache_dir, f"{cache_key}.json")
     
-    def save(self, path: str, data: Any, metadata: Optional[Dict] = None, repo_stats: Optional[Dict] = None) -> None:
+    def save(
+        self,
+        path: str,
+        data: Any,
+        metadata: Optional[Dict] = None,
+        repo_stats: Optional[Dict] = None
+    ) -> None:
         """Save data to cache file with comprehensive metadata.
         
         Args:
@@ -147,22 +158,24 @@ class GitHubCache:
         # Merge with existing cache history if it exists
         if os.path.exists(path):
             try:
-                with open(path, 'r') as f:
-                    existing_cache = json.load(f)
+                with open(path, 'rb') as f:
+                    existing_cache = orjson.loads(f.read())
                     if 'update_history' in existing_cache:
                         cache_content['update_history'] = existing_cache['update_history'] + [update_record]
             except Exception as e:
                 logging.warning(f"Failed to merge cache history: {e}")
         
-        with open(path, 'w') as f:
-            json.dump(cache_content, f, indent=4)
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(cache_content, option=orjson.OPT_INDENT_2))
     
-    def load(self, path: str, use_cache_only: bool = False) -> Optional[Dict]:
+    def load(self, path: str, use_cache_only: bool = False, max_age: Optional[timedelta] = None) -> Optional[Dict]:
         """Load data from cache file if it exists and is not stale.
         
         Args:
             path: Cache file path
             use_cache_only: If True, return cached data regardless of staleness
+            max_age: Optional age after which the data is stale, replacing the
+                default staleness checks
             
         Returns:
             Cache data if available and not stale (or if use_cache_only is True), None otherwise
@@ -170,10 +183,15 @@ class GitHubCache:
         if not os.path.exists(path):
             return None
             
-        with open(path, 'r') as f:
-            cache = json.load(f)
+        with open(path, 'rb') as f:
+            cache = orjson.loads(f.read())
         
-        if not use_cache_only:
+        if not use_cache_only and max_age is not None:
+            last_updated = datetime.fromisoformat(cache['last_updated'])
+            if datetime.utcnow() - last_updated > max_age:
+                logging.info(f"Cache is stale (older than {max_age}), will fetch fresh data")
+                return None
+        elif not use_cache_only:
             # Check basic staleness (1 hour)
             last_updated = datetime.fromisoformat(cache['last_updated'])
             if datetime.utcnow() - last_updated > timedelta(hours=12):
@@ -188,3 +206,44 @@ class GitHubCache:
                     return None
         
         return cache
+    
+    def get_page_path(self, url: str) -> str:
+        """Generate a cache file path for a single page of API results.
+        
+        Args:
+            url: Full page URL, including query parameters
+            
+        Returns:
+            Cache file path
+        """
+        return os.path.join(self.cache_dir, 'pages', f"{hashlib.sha1(url.encode()).hexdigest()}.json")
+    
+    def load_page(self, url: str) -> Optional[Dict]:
+        """Load a cached page of API results.
+        
+        Args:
+            url: Full page URL, including query parameters
+            
+        Returns:
+            Dictionary with the page's etag, links and data, or None if the
+            page is not cached
+        """
+        path = self.get_page_path(url)
+        if not os.path.exists(path):
+            return None
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    
+    def save_page(self, url: str, etag: str, data: Any, links: Dict[str, str]) -> None:
+        """Save a page of API results with the ETag it was served with.
+        
+        Args:
+            url: Full page URL, including query parameters
+            etag: ETag header of the response
+            data: Parsed page data
+            links: Link header URLs by relation
+        """
+        path = self.get_page_path(url)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps({'etag': etag, 'links': links, 'data': data}))
@@ -1,6 +1,5 @@
 import pandas as pd
 from chart import plot_issue_trends
-import json
 import os
 import sys
 import logging
@@ -11,18 +10,6 @@ from github_api import GitHubAPI
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
-# Constants
-CACHE_DIR = ".cache"
-OUTPUT_DIR = "output"
-
-def save_cache(data, path):
-    with open(path, 'w') as f:
-        json.dump(data, f, indent=4)
-
-def load_cache(path):
-    with open(path, 'r') as f:
-        return json.load(f)
-
 def fetch_issues(repo: str, token: str, use_cache_only: bool = False, fetch_limit: Optional[int] = None) -> list:
     """Fetch issues from GitHub API with caching support.
     
@@ -45,8 +32,9 @@ def fetch_issues(repo: str, token: str, use_cache_only: bool = False, fetch_limi
 
 def create_issues_df(issues):
     df = pd.DataFrame(issues)
-    df['created_at'] = pd.to_datetime(df['created_at'], errors='coerce').dt.date
-    df['closed_at'] = pd.to_datetime(df['closed_at'], errors='coerce').dt.date
+    # Keep dates as naive datetime64 days rather than Python date objects
+    df['created_at'] = pd.to_datetime(df['created_at'], errors='coerce', utc=True).dt.tz_localize(None).dt.normalize()
+    df['closed_at'] = pd.to_datetime(df['closed_at'], errors='coerce', utc=True).dt.tz_localize(None).dt.normalize()
     # Add state column explicitly
     df['state'] = df['state'].astype(str)
     return df